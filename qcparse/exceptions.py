@@ -3,9 +3,17 @@ class BaseError(Exception):
 
 
 class MatchNotFoundError(BaseError):
-    """Exception raised when a parsing match is not found"""
+    """Exception raised when a parsing match is not found
+
+    Only the end of the searched string is kept so the exception and its traceback
+    do not hold a reference to an entire (potentially very large) output file.
+    """
+
+    max_string_length = 1024
 
     def __init__(self, regex: str, string: str):
+        if len(string) > self.max_string_length:
+            string = "..." + string[-self.max_string_length :]
         self.regex = regex
         self.string = string
         super().__init__(
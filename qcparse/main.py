@@ -2,7 +2,7 @@
 
 from importlib import import_module
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Optional, Tuple, Union
 
 from qcio import (
     SinglePointComputedProperties,
@@ -58,7 +58,7 @@ def parse_computed_props(
         calc_type = None
 
     # Get all the parsers for the program and filetype
-    parsers: List[ParserSpec] = registry.get_parsers(
+    parsers: Tuple[ParserSpec, ...] = registry.get_parsers(
         program,
         filetype=filetype,
         collect_inputs=False,
@@ -140,7 +140,7 @@ def parse(
     #     calc_type = None
 
     # # Get all the parsers for the program and filetype
-    # parsers: List[ParserSpec] = registry.get_parsers(
+    # parsers: Tuple[ParserSpec, ...] = registry.get_parsers(
     #     program,
     #     filetype=filetype,
     #     collect_inputs=collect_inputs,
@@ -6,42 +6,74 @@ All parsers should follow a basic pattern:
 2. Raise a MatchNotFound error if a match was not found
 3. Register parser with the registry by decorating it with the parser() decorator
 
-Use the regex_search() helper function implemented below in place of re.search() to
-ensure that a MatchNotFoundError will be raised in a parser. More sophisticated parsers
-that use re.findall (like parse_hessian) or rely upon not finding a match may implement
-a different interface, but please strive to follow this basic patterns as much as
-possible.
+Use the first_group() helper function with a pattern precompiled at module level in
+place of re.search() to ensure that a MatchNotFoundError will be raised in a parser.
+regex_search() remains available for parsers that need the full re.Match object. More
+sophisticated parsers that use re.findall (like parse_hessian) or rely upon not finding
+a match may implement a different interface, but please strive to follow this basic
+patterns as much as possible.
 """
 
+import math
 import re
 from enum import Enum
 from pathlib import Path
 from typing import Optional, Union
 
+import numpy as np
 from qcio import Molecule, SinglePointInput, SPCalcType
 
 from qcparse.exceptions import MatchNotFoundError
 from qcparse.models import ParsedDataCollector
 
-from .utils import parser, regex_search
+from .utils import first_group, parser
 
 
 class FileType(str, Enum):
     stdout = "stdout"
 
 
+_CALC_TYPES = {
+    "SINGLE POINT ENERGY CALCULATIONS": SPCalcType.energy,
+    "SINGLE POINT GRADIENT CALCULATIONS": SPCalcType.gradient,
+    "FREQUENCY ANALYSIS": SPCalcType.hessian,
+}
+
+# Matches banners like '**** SINGLE POINT GRADIENT CALCULATIONS ****'; the banner
+# asterisks anchor the search
+_CALC_TYPE_RE = re.compile(r"\*\*\*\* ({})".format("|".join(_CALC_TYPES)))
+_ENERGY_RE = re.compile(r"FINAL ENERGY: (-?\d+(?:\.\d+)?)")
+_METHOD_RE = re.compile(r"Method: (\S+)")
+_WORKING_DIR_RE = re.compile(r"Scratch directory: (.*?)\n")
+_BASIS_RE = re.compile(r"Using basis set: (\S+)")
+_GIT_COMMIT_RE = re.compile(r"Git Version: (\S*)")
+_VERSION_RE = re.compile(r"TeraChem (v\S*)")
+# Captures all floats after the dE/dX dE/dY dE/dZ header up to the terminating ---- line
+_GRADIENT_RE = re.compile(r"dE/dX\s{12}dE/dY\s{12}dE/dZ\n([\d\.\-\s]+?)\n-{2,}")
+_HESSIAN_BLOCK_RE = re.compile(
+    r"\*\*\* Hessian Matrix \(Hartree/Bohr\^2\) \*\*\*\n(.*?)(?:\n\n\n|\Z)", re.DOTALL
+)
+# Hessian rows are a row index followed by up to six floats in scientific notation
+_HESSIAN_ROW_RE = re.compile(
+    r"^[ \t]*\d+((?:[ \t]+-?\d\.\d{15}e[+-]\d{2})+)[ \t]*$", re.MULTILINE
+)
+_NATOMS_RE = re.compile(r"Total atoms:\s*(\d+)")
+_NMO_RE = re.compile(r"Total orbitals:\s*(\d+)")
+_XYZ_RE = re.compile(r"XYZ coordinates (.+)")
+_CHARGE_RE = re.compile(r"Total charge:\s*(-?\d+)")
+_SPIN_RE = re.compile(r"Spin multiplicity:\s*(\d+)")
+
+
 def parse_calc_type(string: str) -> SPCalcType:
     """Parse the calc_type from TeraChem stdout."""
-    calc_types = (
-        (SPCalcType.energy, r"SINGLE POINT ENERGY CALCULATIONS"),
-        (SPCalcType.gradient, r"SINGLE POINT GRADIENT CALCULATIONS"),
-        (SPCalcType.hessian, r"FREQUENCY ANALYSIS"),
-    )
-    for calc_type, regex in calc_types:
-        match = re.search(regex, string)
-        if match:
+    match = _CALC_TYPE_RE.search(string)
+    if match is not None:
+        return _CALC_TYPES[match.group(1)]
+    # Fall back to the bare labels for output without the usual banner formatting
+    for label, calc_type in _CALC_TYPES.items():
+        if label in string:
             return calc_type
-    raise MatchNotFoundError(regex, string)
+    raise MatchNotFoundError(_CALC_TYPE_RE.pattern, string)
 
 
 def post_process(
@@ -77,45 +109,37 @@ def parse_energy(string: str, data_collector: ParsedDataCollector):
         - Works on frequency files containing many energy values because re.search()
             returns the first result
     """
-    regex = r"FINAL ENERGY: (-?\d+(?:\.\d+)?)"
-    data_collector.computed.energy = float(regex_search(regex, string).group(1))
+    data_collector.computed.energy = float(first_group(_ENERGY_RE, string))
 
 
 @parser(filetype=FileType.stdout, input_data=True)
 def parse_method(string: str, data_collector: ParsedDataCollector):
     """Parse the method from TeraChem stdout."""
-    regex = r"Method: (\S+)"
-    data_collector.input_data.program_args.model.method = regex_search(
-        regex, string
-    ).group(1)
+    data_collector.input_data.program_args.model.method = first_group(
+        _METHOD_RE, string
+    )
 
 
 @parser(filetype=FileType.stdout)
 def parse_working_directory(string: str, data_collector: ParsedDataCollector):
     """Parse the scratch directory from TeraChem stdout."""
-    regex = r"Scratch directory: (.*?)\n"
-    data_collector.provenance.working_dir = regex_search(regex, string).group(1)
+    data_collector.provenance.working_dir = first_group(_WORKING_DIR_RE, string)
 
 
 @parser(filetype=FileType.stdout, input_data=True)
 def parse_basis(string: str, data_collector: ParsedDataCollector):
     """Parse the basis from TeraChem stdout."""
-    regex = r"Using basis set: (\S+)"
-    data_collector.input_data.program_args.model.basis = regex_search(
-        regex, string
-    ).group(1)
+    data_collector.input_data.program_args.model.basis = first_group(_BASIS_RE, string)
 
 
 def parse_git_commit(string: str) -> str:
     """Parse TeraChem git commit from TeraChem stdout."""
-    regex = r"Git Version: (\S*)"
-    return regex_search(regex, string).group(1)
+    return first_group(_GIT_COMMIT_RE, string)
 
 
 def parse_terachem_version(string: str) -> str:
     """Parse TeraChem version from TeraChem stdout."""
-    regex = r"TeraChem (v\S*)"
-    return regex_search(regex, string).group(1)
+    return first_group(_VERSION_RE, string)
 
 
 def parse_version_string(string: str) -> str:
@@ -132,18 +156,28 @@ def parse_version(string: str, data_collector: ParsedDataCollector):
     data_collector.provenance.program_version = parse_version_string(string)
 
 
-# Factored out for use in calculation_succeeded and parse_failure_text
+# Factored out for use in calculation_succeeded and parse_failure_text. Keep these
+# free of capturing groups (use (?:...) if needed) since callers only test for a match.
 FAILURE_REGEXPS = (
     r"DIE called at line number .*",
     r"CUDA error:.*",
 )
+_FAILURE_RES = tuple(re.compile(regex) for regex in FAILURE_REGEXPS)
+# TeraChem exits immediately after printing a failure message, so only the end of
+# stdout needs to be searched for one
+_FAILURE_TAIL_SIZE = 16384
 
 
 # TODO: Handle failures
 def calculation_succeeded(string: str) -> bool:
-    """Determine from TeraChem stdout if a calculation competed successfully."""
-    for regex in FAILURE_REGEXPS:
-        if re.search(regex, string):
+    """Determine from TeraChem stdout if a calculation competed successfully.
+
+    NOTE:
+        - Only the last _FAILURE_TAIL_SIZE characters of stdout are searched.
+    """
+    tail_start = max(len(string) - _FAILURE_TAIL_SIZE, 0)
+    for pattern in _FAILURE_RES:
+        if pattern.search(string, tail_start) is not None:
             # If any match for a failure regex is found, the calculation failed
             return False
     return True
@@ -152,20 +186,11 @@ def calculation_succeeded(string: str) -> bool:
 @parser(filetype=FileType.stdout, only=[SPCalcType.gradient, SPCalcType.hessian])
 def parse_gradient(string: str, data_collector: ParsedDataCollector):
     """Parse gradient from TeraChem stdout."""
-    # This will match all floats after the dE/dX dE/dY dE/dZ header and stop at the
-    # terminating ---- line
-    regex = r"(?<=dE\/dX\s{12}dE\/dY\s{12}dE\/dZ\n)[\d\.\-\s]+(?=\n-{2,})"
-    gradient_string = regex_search(regex, string).group()
-
-    # split string and cast to floats
-    values = [float(val) for val in gradient_string.split()]
+    gradient_string = first_group(_GRADIENT_RE, string)
 
-    # arrange into N x 3 gradient
-    gradient = []
-    for i in range(0, len(values), 3):
-        gradient.append(values[i : i + 3])
-
-    data_collector.computed.gradient = gradient
+    # Cast all floats in one pass and arrange into N x 3 gradient
+    values = np.fromstring(gradient_string, dtype=np.float64, sep=" ")
+    data_collector.computed.gradient = values.reshape(-1, 3).tolist()
 
 
 @parser(filetype=FileType.stdout, only=[SPCalcType.hessian])
@@ -173,53 +198,46 @@ def parse_hessian(string: str, data_collector: ParsedDataCollector):
     """Parse Hessian Matrix from TeraChem stdout
 
     Notes:
-        This function searches the entire document N times for all regex matches where
-        N is the number of atoms. This makes the function's code easy to reason about.
-        If performance becomes an issues for VERY large Hessians (unlikely) you can
-        accelerate this function by parsing all Hessian floats in one pass, like the
-        parse_gradient function above, and then doing the math to figure out how to
-        properly sequence those values to from the Hessian matrix given TeraChem's
-        six-column format for printing out Hessian matrix entries.
-
+        The Hessian block is located once and all of its rows parsed in a single pass.
+        TeraChem prints the matrix in blocks of up to six columns, each block listing
+        every row, so the flat values are sequenced back into rows block by block.
     """
-    # requires .format(int). {{}} values are to escape {15|2} for .format()
-    regex = r"(?:\s+{}\s)((?:\s-?\d\.\d{{15}}e[+-]\d{{2}})+)"
-    hessian = []
-
-    # Match all rows containing Hessian data; one set of rows at a time
-    count = 1
-    while matches := re.findall(regex.format(count), string):
-        row = []
-        for match in matches:
-            row.extend([float(val) for val in match.split()])
-        hessian.append(row)
-        count += 1
-
-    if not hessian:
-        raise MatchNotFoundError(regex, string)
+    block = first_group(_HESSIAN_BLOCK_RE, string)
+    rows = _HESSIAN_ROW_RE.findall(block)
+    if not rows:
+        raise MatchNotFoundError(_HESSIAN_ROW_RE.pattern, block)
+
+    # Cast all floats in one pass
+    values = np.fromstring(" ".join(rows), dtype=np.float64, sep=" ")
+
+    n = math.isqrt(values.size)
+    # Assert we have recovered a square Hessian matrix
+    assert n * n == values.size, (
+        "We must have missed some floats. Hessian should be a square matrix. "
+        f"Recovered {values.size} floats which is not a perfect square."
+    )
 
-    # Assert we have created a square Hessian matrix
-    for i, row in enumerate(hessian):
-        assert len(row) == len(
-            hessian
-        ), "We must have missed some floats. Hessian should be a square matrix. Only "
-        f"recovered {len(row)} of {len(hessian)} floats for row {i}."
+    # Each six-column block is n rows x width columns of the flat values
+    column_blocks = []
+    offset = 0
+    for col_start in range(0, n, 6):
+        width = min(6, n - col_start)
+        column_blocks.append(values[offset : offset + n * width].reshape(n, width))
+        offset += n * width
 
-    data_collector.computed.hessian = hessian
+    data_collector.computed.hessian = np.hstack(column_blocks).tolist()
 
 
 @parser(filetype=FileType.stdout)
 def parse_natoms(string: str, data_collector: ParsedDataCollector):
     """Parse number of atoms value from TeraChem stdout"""
-    regex = r"Total atoms:\s*(\d+)"
-    data_collector.computed.calcinfo_natoms = int(regex_search(regex, string).group(1))
+    data_collector.computed.calcinfo_natoms = int(first_group(_NATOMS_RE, string))
 
 
 @parser(filetype=FileType.stdout)
 def parse_nmo(string: str, data_collector: ParsedDataCollector):
     """Parse the number of molecular orbitals TeraChem stdout"""
-    regex = r"Total orbitals:\s*(\d+)"
-    data_collector.computed.calcinfo_nmo = int(regex_search(regex, string).group(1))
+    data_collector.computed.calcinfo_nmo = int(first_group(_NMO_RE, string))
 
 
 def parse_xyz_filepath(string: str) -> Path:
@@ -231,17 +249,14 @@ def parse_xyz_filepath(string: str) -> Path:
     relative to the stdout file and then the top-level parse function will open the
     xyz file and parse the molecule.
     """
-    regex = r"XYZ coordinates (.+)"
-    return Path(regex_search(regex, string).group(1))
+    return Path(first_group(_XYZ_RE, string))
 
 
 def parse_molecule_charge(string: str) -> int:
     """Parse Molecule charge from TeraChem stdout"""
-    regex = r"Total charge:\s*(\d+)"
-    return int(regex_search(regex, string).group(1))
+    return int(first_group(_CHARGE_RE, string))
 
 
 def parse_molecule_spin_multiplicity(string: str) -> int:
     """Parse Molecule spin multiplicity from TeraChem stdout"""
-    regex = r"Spin multiplicity:\s*(\d+)"
-    return int(regex_search(regex, string).group(1))
+    return int(first_group(_SPIN_RE, string))
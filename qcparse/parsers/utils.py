@@ -1,13 +1,16 @@
 import importlib
-import inspect
 import re
-from typing import List, Optional
+from enum import Enum
+from typing import Dict, List, Optional, Type
 
 from qcio import SPCalcType
 
 from qcparse.exceptions import MatchNotFoundError
 from qcparse.registry import registry
 
+# FileType Enums of program modules, keyed by module name
+_FILETYPES: Dict[str, Type[Enum]] = {}
+
 
 def parser(
     filetype: str,
@@ -32,11 +35,14 @@ def parser(
 
     def decorator(func):
         # Get the current module name. Should match program name.
-        module = inspect.getmodule(func).__name__
+        module = func.__module__
         program_name = module.split(".")[-1]
 
         # Dynamically import the relevant Enum module
-        supported_file_types = importlib.import_module(f"{module}").FileType
+        supported_file_types = _FILETYPES.get(module)
+        if supported_file_types is None:
+            supported_file_types = importlib.import_module(module).FileType
+            _FILETYPES[module] = supported_file_types
 
         # Check if filetype is a member of the relevant Enum
         if filetype not in supported_file_types.__members__:
@@ -79,6 +85,28 @@ def regex_search(regex: str, string: str) -> re.Match:
         MatchNotFoundError if no match found.
     """
     match = re.search(regex, string)
-    if not match:
+    if match is None:
         raise MatchNotFoundError(regex, string)
     return match
+
+
+def first_group(pattern: re.Pattern, string: str) -> str:
+    """Return the first capture group of the first match of a precompiled pattern.
+
+    Shorthand for regex_search(pattern, string).group(1) for the common case of
+    parsers that extract a single value.
+
+    Args:
+        pattern: A precompiled re.Pattern with at least one capture group.
+        string: The string to match on.
+
+    Returns:
+        The text captured by the first group.
+
+    Raises:
+        MatchNotFoundError if no match found.
+    """
+    match = pattern.search(string)
+    if match is None:
+        raise MatchNotFoundError(pattern.pattern, string)
+    return match.group(1)
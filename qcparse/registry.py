@@ -1,13 +1,17 @@
 from collections import defaultdict
-from typing import Callable, Dict, List, Optional
+from enum import Enum
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
-from pydantic import BaseModel
 from qcio import SPCalcType
 
 from .exceptions import RegistryError
 
+_ALL_CALC_TYPES = frozenset(
+    (SPCalcType.energy, SPCalcType.gradient, SPCalcType.hessian)
+)
 
-class ParserSpec(BaseModel):
+
+class ParserSpec(NamedTuple):
     """Information about a parser function.
 
     Attributes:
@@ -16,20 +20,25 @@ class ParserSpec(BaseModel):
         required: Whether the parser is required to be successful for the parsing to
             be considered successful. If True and the parser fails a MatchNotFoundError
             will be raised. If False and the parser fails the value will be ignored.
-        calc_types: The calculation types that the parser work on.
+        input_data: Whether the parser is for input data rather than computed output.
+        calc_types: The calculation types that the parser work on. Defaults to all
+            calculation types.
     """
 
     parser: Callable
     filetype: str
     required: bool
     input_data: bool = False
-    calc_types: List[SPCalcType]
+    calc_types: FrozenSet[SPCalcType] = _ALL_CALC_TYPES
 
 
-class ParserRegistry(BaseModel):
+class ParserRegistry:
     """Registry for parser functions."""
 
-    registry: Dict[str, List[ParserSpec]] = defaultdict(list)
+    def __init__(self) -> None:
+        self.registry: Dict[str, List[ParserSpec]] = defaultdict(list)
+        # Filtered results of get_parsers keyed by its arguments
+        self._cache: Dict[tuple, Tuple[ParserSpec, ...]] = {}
 
     def register(
         self,
@@ -55,14 +64,15 @@ class ParserRegistry(BaseModel):
         """
         parser_info = ParserSpec(
             parser=parser,
-            filetype=filetype,
+            # Store the plain str value of Enum members, e.g., FileType.stdout
+            filetype=filetype.value if isinstance(filetype, Enum) else filetype,
             required=required,
             input_data=input_data,
             # If only not passed then register for all calculation types
-            calc_types=only
-            or [SPCalcType.energy, SPCalcType.gradient, SPCalcType.hessian],
+            calc_types=frozenset(only) if only else _ALL_CALC_TYPES,
         )
         self.registry[program].append(parser_info)
+        self._cache.clear()
 
     def get_parsers(
         self,
@@ -70,9 +80,11 @@ class ParserRegistry(BaseModel):
         filetype: Optional[str] = None,
         collect_inputs: bool = True,
         calc_type: Optional[SPCalcType] = None,
-    ) -> List[ParserSpec]:
+    ) -> Tuple[ParserSpec, ...]:
         """Get all parser functions for a given program.
 
+        Results are cached until a new parser is registered.
+
         Args:
             program: The program to get parsers for.
             filetype: If given only return parsers for this filetype.
@@ -80,9 +92,14 @@ class ParserRegistry(BaseModel):
             calc_type: Filter parsers for a given calculation type.
 
         Returns:
-            List of ParserSpec objects.
+            Tuple of ParserSpec objects.
 
         """
+        key = (program, filetype, collect_inputs, calc_type)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
 
         parsers: List[ParserSpec] = self.registry[program]
         if not parsers:
@@ -96,7 +113,9 @@ class ParserRegistry(BaseModel):
 
         if calc_type:
             parsers = [p_spec for p_spec in parsers if calc_type in p_spec.calc_types]
-        return parsers
+
+        self._cache[key] = tuple(parsers)
+        return self._cache[key]
 
     def supported_programs(self) -> List[str]:
         """Get all programs with registered parsers.
@@ -115,11 +134,7 @@ class ParserRegistry(BaseModel):
         Returns:
             List of filetypes.
         """
-        return list(
-            set(
-                [str(parser_info.filetype) for parser_info in self.get_parsers(program)]
-            )
-        )
+        return list({parser_info.filetype for parser_info in self.get_parsers(program)})
 
 
 registry = ParserRegistry()
@@ -1,3 +1,4 @@
+import mmap
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
@@ -6,6 +7,34 @@ from qcio import Molecule
 hydrogen_atom = Molecule(symbols=["H"], geometry=[[0, 0, 0]])
 
 
+def read_file(filepath: Path) -> Union[str, bytes]:
+    """Read a file, returning a str if it is valid UTF-8 and bytes otherwise.
+
+    The file is memory-mapped and decoded directly from the map so large outputs are
+    never held in memory as both bytes and str.
+
+    Args:
+        filepath: Path to the file to read.
+
+    Returns:
+        The decoded file contents or the raw bytes if they are not valid UTF-8.
+    """
+    with open(filepath, "rb") as f:
+        buffer: Union[mmap.mmap, bytes]
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and some special files cannot be memory-mapped
+            buffer = f.read()
+        try:
+            return str(buffer, "utf-8")
+        except UnicodeDecodeError:
+            return bytes(buffer)
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+
 def get_file_content(
     data_or_path: Union[str, bytes, Path]
 ) -> Tuple[Union[str, bytes], Optional[Path]]:
@@ -26,12 +55,7 @@ def get_file_content(
     filepath = Path(data_or_path)
     try:
         if filepath.is_file():
-            # Read the file contents
-            file_content = filepath.read_bytes()
-            try:
-                file_content = file_content.decode("utf-8")
-            except UnicodeDecodeError:
-                pass
+            file_content = read_file(filepath)
         else:
             file_content = str(data_or_path)
             filepath = None
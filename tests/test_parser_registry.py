@@ -1,7 +1,7 @@
 import pytest
 
 from qcparse.exceptions import RegistryError
-from qcparse.registry import ParserSpec, registry
+from qcparse.registry import ParserRegistry, ParserSpec, registry
 
 
 def test_get_parsers_program():
@@ -48,3 +48,24 @@ def test_supported_filetypes():
     filetypes = registry.supported_filetypes("terachem")
     assert filetypes
     assert "stdout" in filetypes
+
+
+def test_get_parsers_cached():
+    parsers = registry.get_parsers("terachem", calc_type="gradient")
+    assert registry.get_parsers("terachem", calc_type="gradient") is parsers
+
+
+def test_register_clears_get_parsers_cache():
+    test_registry = ParserRegistry()
+    test_registry.register("program", print, "stdout", True, False, None)
+    parsers = test_registry.get_parsers("program")
+    assert len(parsers) == 1
+
+    test_registry.register("program", print, "stdout", True, False, None)
+    assert len(test_registry.get_parsers("program")) == 2
+
+
+def test_parser_spec_defaults():
+    spec = ParserSpec(parser=print, filetype="stdout", required=True)
+    assert spec.input_data is False
+    assert set(spec.calc_types) == {"energy", "gradient", "hessian"}
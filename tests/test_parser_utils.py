@@ -0,0 +1,27 @@
+import re
+
+import pytest
+
+from qcparse.exceptions import MatchNotFoundError
+from qcparse.parsers.utils import first_group, regex_search
+
+
+def test_regex_search():
+    match = regex_search(r"Total atoms:\s*(\d+)", "Total atoms:     3")
+    assert match.group(1) == "3"
+
+
+def test_regex_search_raises_exception():
+    with pytest.raises(MatchNotFoundError):
+        regex_search(r"Total atoms:\s*(\d+)", "No atoms here")
+
+
+def test_first_group():
+    assert first_group(re.compile(r"Method: (\S+)"), "Method: B3LYP \n") == "B3LYP"
+
+
+def test_first_group_raises_exception():
+    pattern = re.compile(r"Method: (\S+)")
+    with pytest.raises(MatchNotFoundError) as excinfo:
+        first_group(pattern, "No method here")
+    assert excinfo.value.regex == pattern.pattern
@@ -5,6 +5,7 @@ from qcio import SPCalcType
 
 from qcparse.exceptions import MatchNotFoundError
 from qcparse.parsers.terachem import (
+    _FAILURE_TAIL_SIZE,
     calculation_succeeded,
     parse_basis,
     parse_calc_type,
@@ -59,6 +60,17 @@ def test_parse_energy_raises_exception(data_collector):
         parse_energy("No energy here", data_collector)
 
 
+def test_parse_energy_exception_truncates_string(data_collector):
+    with pytest.raises(MatchNotFoundError) as excinfo:
+        parse_energy("x" * 100000 + "end of output", data_collector)
+    max_length = MatchNotFoundError.max_string_length
+    assert len(excinfo.value.string) == max_length + len("...")
+    assert (
+        excinfo.value.string == "..." + ("x" * 100000 + "end of output")[-max_length:]
+    )
+    assert excinfo.value.string.endswith("end of output")
+
+
 @pytest.mark.parametrize(
     "filename,calc_type",
     (
@@ -73,6 +85,18 @@ def test_parse_calc_type(test_data_dir, filename, calc_type):
     assert parse_calc_type(string) == calc_type
 
 
+@pytest.mark.parametrize(
+    "string,calc_type",
+    (
+        ("**** SINGLE POINT GRADIENT CALCULATIONS ****", SPCalcType.gradient),
+        ("SINGLE POINT GRADIENT CALCULATIONS", SPCalcType.gradient),
+        ("FREQUENCY ANALYSIS", SPCalcType.hessian),
+    ),
+)
+def test_parse_calc_type_banner_and_bare_label(string, calc_type):
+    assert parse_calc_type(string) == calc_type
+
+
 def test_parse_calc_type_raises_exception():
     with pytest.raises(MatchNotFoundError):
         parse_calc_type("No driver here")
@@ -138,6 +162,20 @@ def test_calculation_succeeded(terachem_energy_stdout):
     )
 
 
+def test_calculation_succeeded_failure_after_long_output(test_data_dir):
+    with open(test_data_dir / "failure.basis.out") as f:
+        tcout = f.read()
+    # Failure text at the end of a long stdout is still found
+    assert calculation_succeeded("x" * 100000 + tcout) is False
+
+
+def test_calculation_succeeded_only_searches_tail(test_data_dir):
+    with open(test_data_dir / "failure.basis.out") as f:
+        tcout = f.read()
+    # Failure text followed by more than _FAILURE_TAIL_SIZE characters is not found
+    assert calculation_succeeded(tcout + "x" * (_FAILURE_TAIL_SIZE + 1)) is True
+
+
 @pytest.mark.parametrize(
     "filename,result",
     (
@@ -197,6 +235,11 @@ def test_parse_hessian(test_data_dir, filename, hessian, data_collector):
     assert data_collector.computed.hessian == hessian
 
 
+def test_parse_hessian_raises_exception(terachem_energy_stdout, data_collector):
+    with pytest.raises(MatchNotFoundError):
+        parse_hessian(terachem_energy_stdout, data_collector)
+
+
 @pytest.mark.parametrize(
     "filename,n_atoms",
     (("water.energy.out", 3), ("caffeine.gradient.out", 24)),
@@ -232,6 +275,10 @@ def test_parse_molecule_charge(test_data_dir, filename, charge):
     assert n == charge
 
 
+def test_parse_molecule_charge_negative():
+    assert parse_molecule_charge("Total charge:    -1\nTotal orbitals:  13") == -1
+
+
 @pytest.mark.parametrize(
     "filename,multiplicity",
     (("water.energy.out", 1), ("caffeine.gradient.out", 1)),
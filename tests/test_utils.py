@@ -23,6 +23,15 @@ def test_get_file_contents_with_path_to_bytes(tmp_path):
     assert filepath == path
 
 
+def test_get_file_contents_with_path_to_empty_file(tmp_path):
+    """Test get_file_contents with a Path to an empty file"""
+    path = tmp_path / "test"
+    path.write_bytes(b"")
+    file_content, filepath = get_file_content(path)
+    assert file_content == ""
+    assert filepath == path
+
+
 def test_file_contents_with_path_object(test_data_dir):
     """Test get_file_contents with a Path object"""
     path = Path(test_data_dir / "water.energy.out")